@@ -2,13 +2,15 @@
 
 import os
 import sys
-import json
+import functools
 from tkinter import messagebox
+from json_utils import load_json, save_json
 
 API_KEY_FILENAME = "api_credentials.json"
 
+@functools.cache
 def get_app_base_path():
-    """Return the directory of the running script or executable."""
+    """Return the directory of the running script or executable (fixed for the process)."""
     if getattr(sys, 'frozen', False):
         # Running as compiled exe (PyInstaller)
         return os.path.dirname(sys.executable)
@@ -16,6 +18,7 @@ def get_app_base_path():
         # Running as normal Python script
         return os.path.dirname(os.path.abspath(__file__))
 
+@functools.cache
 def get_credentials_path():
     """Return the absolute path to api_credentials.json inside app directory."""
     base_path = get_app_base_path()
@@ -31,28 +34,33 @@ def save_credentials(engine, creds):
         "creds": creds
     }
     try:
-        with open(key_file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        save_json(data, key_file_path)
+        _read_credentials_file.cache_clear()
         print(f"✅ Credentials saved in {key_file_path}")
     except Exception as e:
         messagebox.showwarning("Warning", f"Could not save credentials:\n{e}")
 
+@functools.lru_cache(maxsize=4)
+def _read_credentials_file(path, mtime_ns):
+    """Parse the credentials file; cached until its modification time changes."""
+    data = load_json(path)
+    return data.get("engine"), data.get("creds")
+
 def load_credentials():
     """
     Load credentials from application directory.
     Returns (engine, creds) or (None, None)
     """
     key_file_path = get_credentials_path()
-    if os.path.exists(key_file_path):
-        try:
-            with open(key_file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                engine = data.get("engine")
-                creds = data.get("creds")
-                if engine and creds:
-                    return engine, creds
-        except Exception as e:
-            messagebox.showwarning("Warning", f"Could not read saved credentials:\n{e}")
+    try:
+        mtime_ns = os.stat(key_file_path).st_mtime_ns
+        engine, creds = _read_credentials_file(key_file_path, mtime_ns)
+        if engine and creds:
+            return engine, dict(creds)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        messagebox.showwarning("Warning", f"Could not read saved credentials:\n{e}")
     return None, None
 
 def clear_credentials():
@@ -60,9 +68,11 @@ def clear_credentials():
     Delete credentials from the application directory.
     """
     key_file_path = get_credentials_path()
-    if os.path.exists(key_file_path):
-        try:
-            os.remove(key_file_path)
-            print(f"🧹 Credentials cleared from {key_file_path}")
-        except Exception as e:
-            messagebox.showwarning("Warning", f"Could not delete credentials:\n{e}")
+    try:
+        os.remove(key_file_path)
+        _read_credentials_file.cache_clear()
+        print(f"🧹 Credentials cleared from {key_file_path}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        messagebox.showwarning("Warning", f"Could not delete credentials:\n{e}")
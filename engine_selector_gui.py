@@ -2,9 +2,11 @@ import os
 import json
 import subprocess
 import sys
-from tkinter import *
+import threading
+import tkinter as tk
 from tkinter import messagebox, simpledialog
 from pathlib import Path
+from json_utils import load_json, save_json
 
 # --------------------------------
 # CONFIG
@@ -13,25 +15,41 @@ APP_DIR = Path(__file__).parent
 CREDENTIALS_FILE = APP_DIR / "api_credentials.json"
 MAIN_GUI = APP_DIR / "translator_main_gui.py"
 
+_creds_cache = None  # filled by the background preload, refreshed on save
+
 # --------------------------------
 # Credentials management
 # --------------------------------
+def _preload_credentials():
+    """Read the credentials file off the UI thread at startup."""
+    global _creds_cache
+    try:
+        _creds_cache = load_json(CREDENTIALS_FILE)
+    except Exception:
+        pass  # Missing or unreadable: load_credentials() reports it on demand
+
+def get_credentials():
+    """Return the preloaded credentials, reading the file only if the preload hasn't finished."""
+    if _creds_cache is None:
+        return load_credentials()
+    return dict(_creds_cache)
+
 def load_credentials():
     if CREDENTIALS_FILE.exists():
         try:
-            with open(CREDENTIALS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_json(CREDENTIALS_FILE)
         except json.JSONDecodeError:
             messagebox.showerror("Error", "Invalid credentials file format.")
     return {}
 
 def save_credentials(data):
-    with open(CREDENTIALS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    global _creds_cache
+    save_json(data, CREDENTIALS_FILE)
+    _creds_cache = dict(data)
     messagebox.showinfo("Saved", f"✅ Credentials saved to {CREDENTIALS_FILE}")
 
 def prompt_for_credentials(engine):
-    creds = load_credentials()
+    creds = get_credentials()
 
     if engine == "openai":
         key = simpledialog.askstring("OpenAI API Key", "Enter your OpenAI API Key (sk-...):", show="*")
@@ -53,7 +71,7 @@ def prompt_for_credentials(engine):
 
 def verify_engine_credentials():
     engine = engine_var.get()
-    creds = load_credentials()
+    creds = get_credentials()
 
     if engine not in creds:
         res = messagebox.askyesno(
@@ -71,7 +89,7 @@ def launch_main_gui(engine):
         messagebox.showerror("Error", f"Cannot find translator_main_gui.py in:\n{MAIN_GUI}")
         return
 
-    creds = load_credentials()
+    creds = get_credentials()
     if engine not in creds:
         messagebox.showerror("Error", f"No credentials found for {engine.capitalize()}.\nPlease add them first.")
         return
@@ -85,34 +103,36 @@ def launch_main_gui(engine):
 # --------------------------------
 # UI
 # --------------------------------
-root = Tk()
+threading.Thread(target=_preload_credentials, daemon=True).start()
+
+root = tk.Tk()
 root.title("JSON Translator – Engine Setup")
 root.geometry("360x230")
 root.resizable(False, False)
 
-Label(root, text="Select Translation Engine", font=("Arial", 14, "bold")).pack(pady=10)
+tk.Label(root, text="Select Translation Engine", font=("Arial", 14, "bold")).pack(pady=10)
 
-engine_var = StringVar(value="openai")
-Radiobutton(root, text="OpenAI", variable=engine_var, value="openai").pack(anchor=W, padx=30)
-Radiobutton(root, text="Amazon Translate", variable=engine_var, value="amazon").pack(anchor=W, padx=30)
+engine_var = tk.StringVar(value="openai")
+tk.Radiobutton(root, text="OpenAI", variable=engine_var, value="openai").pack(anchor=tk.W, padx=30)
+tk.Radiobutton(root, text="Amazon Translate", variable=engine_var, value="amazon").pack(anchor=tk.W, padx=30)
 
-Button(
+tk.Button(
     root,
     text="Check / Add API Keys",
     command=verify_engine_credentials,
     bg="#1976d2",
     fg="white"
-).pack(pady=12, fill=X, padx=40)
+).pack(pady=12, fill=tk.X, padx=40)
 
-Button(
+tk.Button(
     root,
     text="Continue →",
     bg="#2e7d32",
     fg="white",
     font=("Arial", 11, "bold"),
     command=lambda: launch_main_gui(engine_var.get())
-).pack(pady=5, fill=X, padx=40)
+).pack(pady=5, fill=tk.X, padx=40)
 
-Label(root, text="© 2025 JSON Translator", fg="gray", font=("Arial", 8)).pack(side=BOTTOM, pady=5)
+tk.Label(root, text="© 2025 JSON Translator", fg="gray", font=("Arial", 8)).pack(side=tk.BOTTOM, pady=5)
 
 root.mainloop()
@@ -0,0 +1,68 @@
+# json_utils.py
+# ---------------------------------------
+# JSON read/write helpers shared by the translators and credential files.
+# Documents always go through stdlib json: orjson writes floats differently
+# (1e20 vs 1e+20), rejects NaN and turns integers wider than 64 bits into
+# floats, so it would not round-trip files unchanged. orjson, when
+# installed, only encodes the compact request payloads.
+# ---------------------------------------
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+
+def loads(raw):
+    """Parse JSON from str or bytes."""
+    return json.loads(raw)
+
+
+def dumps(data):
+    """Serialize to UTF-8 bytes, indented by 2 spaces, non-ASCII kept as-is."""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dumps_compact(data):
+    """Serialize to a compact str (no indentation), non-ASCII kept as-is."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode("utf-8")
+        except TypeError:  # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+# --------------------------
+# File Helpers
+# --------------------------
+# Whole-file reads/writes: one read() into a pre-sized buffer, one write()
+def read_json_bytes(path):
+    return Path(path).read_bytes()
+
+
+def write_json_bytes(payload, path):
+    """
+    Write atomically: the bytes go to a sibling temp file which then replaces
+    the target, so an interrupted save never leaves a truncated file behind.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_json(path):
+    return loads(read_json_bytes(path))
+
+
+def save_json(data, path):
+    write_json_bytes(dumps(data), path)
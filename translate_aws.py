@@ -2,39 +2,49 @@
 
 import boto3
 
+# Successful verifications only, keyed on (access_key, secret_key)
+_VERIFIED_CLIENTS = {}
+
+def make_aws_client(access_key, secret_key):
+    """
+    Build a Translate client. boto3 clients are thread-safe, so one client
+    (and its connection pool) is shared by every batch of a run.
+    """
+    return boto3.client(
+        "translate",
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name="us-east-1"
+    )
+
 def verify_aws_credentials(access_key, secret_key):
     """
     Verify AWS Translate credentials by attempting a simple operation.
     Returns boto3 client if valid, None otherwise.
+    Valid credentials are remembered so repeated checks skip the network.
     """
+    cache_key = (access_key, secret_key)
+    client = _VERIFIED_CLIENTS.get(cache_key)
+    if client is not None:
+        return client
     try:
-        client = boto3.client(
-            "translate",
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name="us-east-1"
-        )
+        client = make_aws_client(access_key, secret_key)
         # Simple call to check credentials (list_texts if exists or dummy)
         _ = client.list_texts() if hasattr(client, "list_texts") else True
-        return client
     except Exception:
         return None
+    _VERIFIED_CLIENTS[cache_key] = client
+    return client
 
-def amazon_translate_batch(access_key, secret_key, texts, source_lang, target_lang):
+def amazon_translate_batch(client, texts, source_lang, target_lang):
     """
+    client: Translate client from make_aws_client
     texts: list of plain strings ONLY
     Returns list of translated strings
     """
     if source_lang == target_lang:
         return texts
 
-    client = boto3.client(
-        "translate",
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        region_name="us-east-1"
-    )
-
     translations = []
     for text in texts:
         if not isinstance(text, str):
@@ -1,39 +1,135 @@
 # translate_openai.py
 
-import json
-from openai import OpenAI
+import hashlib
+from openai import OpenAI, AsyncOpenAI
+from json_utils import loads, dumps_compact
+
+MODEL = "gpt-4o-mini"
+SYSTEM_PROMPT = "You are a professional translator."
+USER_PROMPT = (
+    "Translate the following JSON array of texts from {source_lang} to {target_lang}. "
+    "Return the translations in the same order, preserve quotes and punctuation, human-like style.\n\n"
+    "{texts}"
+)
+# Names the model + prompt pair in the translation cache; editing either
+# changes the tag, so earlier cached translations are no longer served
+CACHE_TAG = f"{MODEL}:" + hashlib.blake2b(
+    (SYSTEM_PROMPT + USER_PROMPT).encode("utf-8"), digest_size=4
+).hexdigest()
+
+# Successful verifications only; a failed check is retried next time
+_VERIFIED_CLIENTS = {}
+# One client per API key for the life of the process, so its keep-alive
+# connection pool survives across batches, runs and the verification call
+_CLIENT_CACHE = {}
+
+class TranslationResponseError(ValueError):
+    """The reply was cut off or is not the requested {"translations": [...]} object."""
+
+def make_openai_client(key):
+    """Return the shared client for this key, creating it on first use."""
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE.setdefault(key, OpenAI(api_key=key))
+    return client
+
+def make_async_openai_client(key):
+    """
+    Async client for one translation run. It is tied to the event loop that
+    uses it, so it is not cached; the caller closes it when the run ends.
+    """
+    return AsyncOpenAI(api_key=key)
 
 def verify_openai_key(key):
+    client = _VERIFIED_CLIENTS.get(key)
+    if client is not None:
+        return client
     try:
-        client = OpenAI(api_key=key)
+        client = make_openai_client(key)
         _ = client.models.list()
-        return client
     except Exception:
         return None
+    _VERIFIED_CLIENTS[key] = client
+    return client
 
-def openai_translate_batch(api_key, texts, source_lang, target_lang):
-    if source_lang == target_lang:
-        return texts
-
-    client = OpenAI(api_key=api_key)
-    prompt = (
-        f"Translate the following JSON array of texts from {source_lang} to {target_lang}. "
-        "Return a JSON array of same length, preserve quotes and punctuation, human-like style.\n\n"
-        f"{json.dumps(texts, ensure_ascii=False)}"
+def _build_request(texts, source_lang, target_lang):
+    """chat.completions.create() arguments shared by the sync and async paths."""
+    prompt = USER_PROMPT.format(
+        source_lang=source_lang, target_lang=target_lang, texts=dumps_compact(texts)
     )
-
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
+    # Structured output: {"translations": [exactly len(texts) strings]}, enforced by strict mode
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "translations",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "translations": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "minItems": len(texts),
+                        "maxItems": len(texts)
+                    }
+                },
+                "required": ["translations"],
+                "additionalProperties": False
+            }
+        }
+    }
+    return dict(
+        model=MODEL,
         messages=[
-            {"role": "system", "content": "You are a professional translator."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ],
+        response_format=response_format,
         temperature=0.7,
         max_tokens=4000
     )
-    translated_json = response.choices[0].message.content.strip()
+
+def _parse_response(response):
+    choice = response.choices[0]
+    if getattr(choice, "finish_reason", None) == "length":
+        raise TranslationResponseError("Translation reply was truncated")
     try:
-        return json.loads(translated_json)
-    except Exception:
-        # fallback
-        return translated_json.splitlines()[:len(texts)]
+        translated = loads(choice.message.content)["translations"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise TranslationResponseError(f"Unreadable translation reply: {e}") from e
+    if not isinstance(translated, list):
+        raise TranslationResponseError("Translation reply has no translations list")
+    return translated
+
+def _blank_mask(texts):
+    """Blank texts are never sent; returns (mask, texts to send)."""
+    empties = [not (text and text.strip()) for text in texts]
+    return empties, [text for text, empty in zip(texts, empties) if not empty]
+
+def _restore_blanks(empties, translated):
+    if len(translated) != empties.count(False):
+        # Length mismatch: hand it back as-is so the caller can split and retry
+        return translated
+    translated_iter = iter(translated)
+    return ["" if empty else next(translated_iter) for empty in empties]
+
+def openai_translate_batch(client, texts, source_lang, target_lang):
+    if source_lang == target_lang:
+        return texts
+
+    empties, to_send = _blank_mask(texts)
+    if not to_send:
+        return ["" for _ in texts]
+    response = client.chat.completions.create(**_build_request(to_send, source_lang, target_lang))
+    return _restore_blanks(empties, _parse_response(response))
+
+async def openai_translate_batch_async(client, texts, source_lang, target_lang):
+    """openai_translate_batch for an AsyncOpenAI client, awaited on the event loop."""
+    if source_lang == target_lang:
+        return texts
+
+    empties, to_send = _blank_mask(texts)
+    if not to_send:
+        return ["" for _ in texts]
+    response = await client.chat.completions.create(**_build_request(to_send, source_lang, target_lang))
+    return _restore_blanks(empties, _parse_response(response))
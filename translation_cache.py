@@ -0,0 +1,80 @@
+# translation_cache.py
+# ---------------------------------------
+# On-disk cache of finished translations, shared across runs.
+# Keyed on (engine, source lang, target lang, hash of the source text),
+# so repeated strings are only ever sent to the API once. The engine key
+# also names the model and prompt (see translator_engine.cache_namespace),
+# so a prompt change starts from an empty cache instead of stale entries.
+# ---------------------------------------
+
+import hashlib
+import os
+import sqlite3
+from credentials_manager import get_app_base_path
+
+CACHE_FILENAME = "translation_cache.db"
+MAX_QUERY_PARAMS = 500  # Stay well under SQLite's bound-parameter limit
+
+
+def get_cache_path():
+    """Return the absolute path to the cache database inside app directory."""
+    return os.path.join(get_app_base_path(), CACHE_FILENAME)
+
+
+def _text_key(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def open_cache(path=None):
+    """
+    Open (creating if needed) the cache database.
+    Returns None when it can't be opened; translation then runs uncached.
+    """
+    try:
+        conn = sqlite3.connect(path or get_cache_path())
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "engine TEXT, src TEXT, tgt TEXT, h BLOB, out TEXT, "
+            "PRIMARY KEY (engine, src, tgt, h)) WITHOUT ROWID"
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"⚠️ Translation cache disabled: {e}")
+        return None
+    return conn
+
+
+def lookup(conn, engine, source_lang, target_lang, texts):
+    """Return {text: translation} for the texts already in the cache."""
+    texts_by_key = {_text_key(text): text for text in texts}
+    keys = list(texts_by_key)
+    hits = {}
+    try:
+        for start in range(0, len(keys), MAX_QUERY_PARAMS):
+            chunk = keys[start:start + MAX_QUERY_PARAMS]
+            rows = conn.execute(
+                "SELECT h, out FROM translations WHERE engine = ? AND src = ? AND tgt = ? "
+                f"AND h IN ({', '.join('?' * len(chunk))})",
+                (engine, source_lang, target_lang, *chunk)
+            )
+            for key, translated in rows:
+                hits[texts_by_key[key]] = translated
+    except sqlite3.Error as e:
+        print(f"⚠️ Translation cache lookup failed: {e}")
+    return hits
+
+
+def store(conn, engine, source_lang, target_lang, texts, translations):
+    """Remember a finished batch; non-string results are not cached."""
+    rows = [
+        (engine, source_lang, target_lang, _text_key(text), translated)
+        for text, translated in zip(texts, translations)
+        if isinstance(translated, str)
+    ]
+    try:
+        conn.executemany("INSERT OR IGNORE INTO translations VALUES (?, ?, ?, ?, ?)", rows)
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"⚠️ Translation cache update failed: {e}")
@@ -5,73 +5,70 @@
 # Creates separate output files per language.
 # ---------------------------------------
 
-import json
-import copy
 import os
-from translate_openai import openai_translate_batch, verify_openai_key
-from translate_aws import amazon_translate_batch, verify_aws_credentials
+import re
+from concurrent.futures import ThreadPoolExecutor
+from json_utils import loads, dumps, read_json_bytes, write_json_bytes
 
-BATCH_SIZE = 10  # Blog content is usually longer, so use slightly larger batches
-
-
-# --------------------------
-# JSON Helpers
-# --------------------------
-def load_json(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def save_json(data, path):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+MAX_WRITE_WORKERS = 4  # Output files written concurrently
+TEXT_NODE_MARKER = re.compile(rb'"type"\s*:\s*"text"')
 
 
 # --------------------------
 # Collect text for translation
 # --------------------------
-def collect_text_nodes(node, path=()):
-    """Collect only text nodes where type == 'text'."""
+def _maybe_has_text_node(raw):
+    """
+    Cheap pre-scan of the raw file: if no '"type": "text"' pair appears
+    anywhere, there is nothing for collect_text_nodes to find.
+    """
+    return TEXT_NODE_MARKER.search(raw) is not None
+
+
+def collect_text_nodes(node):
+    """
+    Collect only text nodes where type == 'text' (iterative, document order).
+    Returns ((text_node, "text"), text) pairs so translations can be written back directly.
+    """
     texts = []
-    if isinstance(node, dict):
-        # Only pick up "text" when this dict represents a text node
-        if node.get("type") == "text" and "text" in node and isinstance(node["text"], str):
-            text_value = node["text"].strip()
-            if text_value:  # avoid empty strings
-                texts.append((path + ("text",), text_value))
-        for key, value in node.items():
-            if isinstance(value, (dict, list)):
-                texts.extend(collect_text_nodes(value, path + (key,)))
-    elif isinstance(node, list):
-        for idx, item in enumerate(node):
-            texts.extend(collect_text_nodes(item, path + (idx,)))
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            # Only pick up "text" when this dict represents a text node
+            if current.get("type") == "text" and isinstance(current.get("text"), str):
+                text_value = current["text"].strip()
+                if text_value:  # avoid empty strings
+                    texts.append(((current, "text"), text_value))
+            children = [value for value in current.values() if isinstance(value, (dict, list))]
+        elif isinstance(current, list):
+            children = [item for item in current if isinstance(item, (dict, list))]
+        else:
+            continue
+        # Push in reverse so the first child is visited next
+        stack.extend(reversed(children))
     return texts
 
 
 # --------------------------
 # Apply Translations
 # --------------------------
-def apply_translations(node, translations, paths):
-    """Apply translated text back to JSON structure."""
-    for path, translated_text in zip(paths, translations):
-        ptr = node
-        for key in path[:-1]:
-            if isinstance(ptr, list):
-                ptr = ptr[int(key)]
-            else:
-                ptr = ptr[key]
-        final_key = path[-1]
-        ptr[final_key] = translated_text
-    return node
+def apply_translations(refs, translations):
+    """Apply translated text back to JSON structure through the collected (node, key) refs."""
+    for (node, key), translated_text in zip(refs, translations):
+        node[key] = translated_text
 
 
 # --------------------------
 # Verify Client Credentials
 # --------------------------
 def verify_and_prepare_client(engine, creds):
+    # Import the engine SDK only when that engine is actually used
     if engine == "openai":
+        from translate_openai import verify_openai_key
         return verify_openai_key(creds.get("openai_key"))
     elif engine == "amazon":
+        from translate_aws import verify_aws_credentials
         return verify_aws_credentials(creds.get("aws_access_key"), creds.get("aws_secret_key"))
     return None
 
@@ -80,8 +77,17 @@ def verify_and_prepare_client(engine, creds):
 # Translation Entry Function
 # --------------------------
 def translate(engine, creds, input_path, output_path, source_lang, target_langs, status_callback=None):
-    data = load_json(input_path)
-    original_data = copy.deepcopy(data)
+    raw = read_json_bytes(input_path)
+
+    # Skip parsing and walking entirely when no text node can exist
+    if not _maybe_has_text_node(raw):
+        if status_callback:
+            status_callback("No valid text nodes found for translation.", batch_count=0)
+        return
+
+    data = loads(raw)
+    # The raw bytes are not needed once parsed; don't hold both for the whole run
+    del raw
 
     # Collect texts
     texts_to_translate = collect_text_nodes(data)
@@ -90,47 +96,39 @@ def translate(engine, creds, input_path, output_path, source_lang, target_langs,
             status_callback("No valid text nodes found for translation.", batch_count=0)
         return
 
-    paths, source_texts = zip(*texts_to_translate)
+    refs, source_texts = zip(*texts_to_translate)
 
-    # Translate per target language
-    for target_lang in target_langs:
-        if status_callback:
-            status_callback(f"Translating to {target_lang}...", batch_count=0)
-
-        all_translations = []
-        for i in range(0, len(source_texts), BATCH_SIZE):
-            batch = list(source_texts[i:i + BATCH_SIZE])
-            if engine == "openai":
-                translated_batch = openai_translate_batch(creds["openai_key"], batch, source_lang, target_lang)
-            elif engine == "amazon":
-                translated_batch = amazon_translate_batch(
-                    creds["aws_access_key"], creds["aws_secret_key"],
-                    batch, source_lang, target_lang
-                )
-            else:
-                raise ValueError("Unknown translation engine")
-
-            all_translations.extend(translated_batch)
+    # Translate every target language concurrently
+    # (asyncio and the cache are only loaded once a translation actually runs)
+    from translator_engine import translate_texts
+    translations_by_lang = translate_texts(
+        engine, creds, source_texts, source_lang, target_langs, status_callback
+    )
 
-            if status_callback:
-                status_callback(f"{len(all_translations)}/{len(source_texts)} texts translated for {target_lang}",
-                                batch_count=len(batch))
+    # ✅ Blog mode output format: <lang>_<filename>.json
+    base_name = os.path.basename(input_path)
+    #lang_output = os.path.join(os.path.dirname(input_path), f"{target_lang}_{base_name}")
 
-        translated_data = apply_translations(copy.deepcopy(original_data), all_translations, paths)
+    # ✅ Save inside Blog folder
+    output_dir = os.path.join(os.path.dirname(input_path), "Blog")
+    os.makedirs(output_dir, exist_ok=True)
 
-        # ✅ Blog mode output format: <lang>_<filename>.json
-        base_name = os.path.basename(input_path)
-        #lang_output = os.path.join(os.path.dirname(input_path), f"{target_lang}_{base_name}")
-        
-        # ✅ Save inside Blog folder
-        output_dir = os.path.join(os.path.dirname(input_path), "Blog")
-        os.makedirs(output_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as executor:
+        pending_writes = []
+        for target_lang in target_langs:
+            all_translations = translations_by_lang[target_lang]
+            # Every language writes the same nodes, so translate the parsed data in place
+            apply_translations(refs, all_translations)
 
-        lang_output = os.path.join(output_dir, f"{target_lang}_{base_name}")
+            lang_output = os.path.join(output_dir, f"{target_lang}_{base_name}")
 
-        
-        save_json(translated_data, lang_output)
+            # Serialize now (the tree is overwritten by the next language),
+            # and let the pool write the file while the next one is prepared
+            payload = dumps(data)
+            pending_writes.append((lang_output, executor.submit(write_json_bytes, payload, lang_output)))
 
-        if status_callback:
-            status_callback(f"✅ Saved translated file: {lang_output}")
+        for lang_output, write in pending_writes:
+            write.result()
+            if status_callback:
+                status_callback(f"✅ Saved translated file: {lang_output}")
 
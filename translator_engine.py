@@ -0,0 +1,215 @@
+# translator_engine.py
+# ---------------------------------------
+# Shared batch dispatch for Blog and Non-Blog modes.
+# Packs texts into character-budgeted batches, sends every
+# (target language, batch) pair concurrently and returns the
+# translations in source order. OpenAI requests are native
+# coroutines; Amazon's blocking SDK runs in worker threads.
+# ---------------------------------------
+
+import asyncio
+import translation_cache
+
+MAX_CONCURRENT_REQUESTS = 4  # Upper bound on in-flight API calls
+MAX_BATCH_CHARS = 4000       # Source characters per request, well inside the provider limits
+MAX_BATCH_TEXTS = 40         # Cap on texts per request, however short they are
+SUPPORTED_ENGINES = ("openai", "amazon")
+
+
+# --------------------------
+# Clients & Single Batch
+# --------------------------
+def make_client(engine, creds):
+    """Create the engine client once per run; it is shared by every batch."""
+    # Engine SDKs are imported on first use, only for the engine actually selected
+    if engine == "openai":
+        from translate_openai import make_async_openai_client
+        return make_async_openai_client(creds["openai_key"])
+    elif engine == "amazon":
+        from translate_aws import make_aws_client
+        return make_aws_client(creds["aws_access_key"], creds["aws_secret_key"])
+    raise ValueError("Unknown translation engine")
+
+
+async def close_client(engine, client):
+    """Release the run's client; the async OpenAI client owns an HTTP pool."""
+    if engine == "openai":
+        await client.close()
+
+
+def cache_namespace(engine):
+    """Translation cache key for the engine, including the OpenAI model and prompt."""
+    if engine == "openai":
+        from translate_openai import CACHE_TAG
+        return f"openai:{CACHE_TAG}"
+    return engine
+
+
+async def translate_batch(engine, client, batch, source_lang, target_lang):
+    """Translate one batch of plain strings with the selected engine."""
+    if engine == "openai":
+        from translate_openai import openai_translate_batch_async
+        return await openai_translate_batch_async(client, batch, source_lang, target_lang)
+    elif engine == "amazon":
+        from translate_aws import amazon_translate_batch
+        return await asyncio.to_thread(amazon_translate_batch, client, batch, source_lang, target_lang)
+    raise ValueError("Unknown translation engine")
+
+
+def is_batch_size_error(engine, error):
+    """
+    True when a smaller batch may succeed: the reply was cut off or malformed,
+    or the request was rejected as invalid or too large (HTTP 400/413).
+    Amazon translates text by text, so splitting never helps there.
+    """
+    if engine != "openai":
+        return False
+    from translate_openai import TranslationResponseError
+    return isinstance(error, TranslationResponseError) or getattr(error, "status_code", None) in (400, 413)
+
+
+async def translate_batch_with_retry(engine, client, batch, source_lang, target_lang):
+    """
+    Translate a batch, halving it when the request is too large for one reply
+    or the engine does not return one string per text. A single text is never
+    split: a bad reply for it raises TranslationResponseError. Any other failure
+    (auth, connection, ...) is raised straight away.
+    """
+    try:
+        translated = await translate_batch(engine, client, batch, source_lang, target_lang)
+    except Exception as e:
+        if len(batch) == 1 or not is_batch_size_error(engine, e):
+            raise
+        translated = None
+    if (isinstance(translated, list) and len(translated) == len(batch)
+            and all(isinstance(text, str) for text in translated)):
+        return translated
+    if len(batch) == 1:
+        from translate_openai import TranslationResponseError
+        if isinstance(translated, list) and len(translated) == 1:
+            raise TranslationResponseError(f"expected a string translation, got {translated[0]!r}")
+        count = len(translated) if isinstance(translated, list) else 0
+        raise TranslationResponseError(f"expected 1 translation, got {count}")
+
+    middle = len(batch) // 2
+    return (
+        await translate_batch_with_retry(engine, client, batch[:middle], source_lang, target_lang)
+        + await translate_batch_with_retry(engine, client, batch[middle:], source_lang, target_lang)
+    )
+
+
+# --------------------------
+# Batch Planning
+# --------------------------
+def plan_batches(texts):
+    """
+    Split texts into (start, end) ranges: short texts are packed together up to
+    MAX_BATCH_CHARS / MAX_BATCH_TEXTS, a long text gets a request of its own.
+    """
+    ranges = []
+    start = 0
+    while start < len(texts):
+        end = start
+        chars = 0
+        while end < len(texts) and end - start < MAX_BATCH_TEXTS:
+            size = len(texts[end])
+            if end > start and chars + size > MAX_BATCH_CHARS:
+                break
+            chars += size
+            end += 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+# --------------------------
+# Concurrent Dispatch
+# --------------------------
+async def translate_texts_async(engine, creds, texts, source_lang, target_langs, status_callback=None):
+    """
+    Translate `texts` into every language of `target_langs` at once.
+    In-flight requests are capped by a semaphore;
+    status_callback is only ever invoked from the event loop thread.
+    Duplicate texts are sent once, and texts found in the translation cache
+    not at all; progress still counts every occurrence.
+    Returns {target_lang: [translations in the same order as texts]}.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    namespace = cache_namespace(engine)
+    done_counts = {target_lang: 0 for target_lang in target_langs}
+
+    def report(target_lang, batch, suffix=""):
+        batch_count = sum(occurrences[text] for text in batch)
+        done_counts[target_lang] += batch_count
+        if status_callback:
+            status_callback(
+                f"{done_counts[target_lang]}/{len(texts)} texts translated for {target_lang}{suffix}",
+                batch_count=batch_count
+            )
+
+    # Unique source texts in first-seen order, with their occurrence counts
+    occurrences = {}
+    for text in texts:
+        occurrences[text] = occurrences.get(text, 0) + 1
+    unique_texts = list(occurrences)
+
+    cache = translation_cache.open_cache()
+    try:
+        # Serve what we can from the cache; only the misses go to the API
+        by_text = {}
+        pending = {}
+        for target_lang in target_langs:
+            hits = translation_cache.lookup(cache, namespace, source_lang, target_lang, unique_texts) if cache else {}
+            by_text[target_lang] = hits
+            pending[target_lang] = [text for text in unique_texts if text not in hits]
+            if hits:
+                report(target_lang, hits, " (cached)")
+
+        async def run_batch(batch, target_lang):
+            async with semaphore:
+                translated = await translate_batch_with_retry(engine, client, batch, source_lang, target_lang)
+            # translate_batch_with_retry only returns one validated string per text
+            if cache:
+                translation_cache.store(cache, namespace, source_lang, target_lang, batch, translated)
+            report(target_lang, batch)
+            return target_lang, batch, translated
+
+        batches = [
+            (pending[target_lang][start:end], target_lang)
+            for target_lang in target_langs
+            for start, end in plan_batches(pending[target_lang])
+        ]
+
+        if batches:
+            client = make_client(engine, creds)
+            try:
+                tasks = [run_batch(batch, target_lang) for batch, target_lang in batches]
+                for target_lang, batch, translated in await asyncio.gather(*tasks):
+                    by_text[target_lang].update(zip(batch, translated))
+            finally:
+                await close_client(engine, client)
+    finally:
+        if cache:
+            cache.close()
+
+    # Fan each unique translation back out to every occurrence
+    return {
+        target_lang: [by_text[target_lang][text] for text in texts]
+        for target_lang in target_langs
+    }
+
+
+def translate_texts(engine, creds, texts, source_lang, target_langs, status_callback=None):
+    """Synchronous wrapper around translate_texts_async for the translation threads."""
+    if engine not in SUPPORTED_ENGINES:
+        raise ValueError("Unknown translation engine")
+
+    if not texts:
+        return {target_lang: [] for target_lang in target_langs}
+
+    if status_callback:
+        status_callback(f"Translating to {', '.join(target_langs)}...", batch_count=0)
+
+    return asyncio.run(
+        translate_texts_async(engine, creds, texts, source_lang, target_langs, status_callback)
+    )
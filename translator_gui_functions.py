@@ -1,23 +1,33 @@
 import os
+import time
 import threading
-from tkinter import *
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import Toplevel, Text, Scrollbar, WORD, END, NORMAL, DISABLED
 from tkinter import messagebox, filedialog, simpledialog, ttk
 from translator_logic import verify_and_prepare_client, load_json, collect_translatable_texts
 from credentials_manager import save_credentials, load_credentials
 
 cancel_flag_global = False  # global flag for canceling translation
+_translation_running = False  # True from a Start click until that run's UI reset
+PROGRESS_MIN_INTERVAL = 0.1  # seconds between progress redraws (~10 Hz)
+JSON_FILETYPES = (("JSON files", "*.json"),)
+OUTPUT_DIRS = {"blog": "Blog", "nonblog": "Non-Blog"}  # output folder per mode
+
+# One long-lived worker runs translations; runs queue up instead of overlapping
+_translation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translation")
 
 
 # --------------------------
 # Status Updates & Popup
 # --------------------------
-def update_status_label(root, status_label, msg, status_text):
-    status_label.config(text=msg)
-    status_label.update()
-    status_text.append(msg)
+def update_status_label(root, status_label, msgs, status_text):
+    """Show the latest of `msgs` and append all of them to the message log."""
+    status_label.config(text=msgs[-1])
+    status_label.update_idletasks()
+    status_text.extend(msgs)
     if hasattr(root, 'messages_popup') and root.messages_popup.winfo_exists():
         root.messages_text_widget.config(state=NORMAL)
-        root.messages_text_widget.insert(END, msg + "\n")
+        root.messages_text_widget.insert(END, "".join(msg + "\n" for msg in msgs))
         root.messages_text_widget.see(END)
         root.messages_text_widget.config(state=DISABLED)
 
@@ -34,17 +44,21 @@ def show_messages_popup(root, messages):
     scrollbar.pack(side="right", fill="y")
     text_widget.config(yscrollcommand=scrollbar.set)
     scrollbar.config(command=text_widget.yview)
-    for msg in messages:
-        text_widget.insert(END, msg + "\n")
+    # One insert for the whole log instead of one Tk round-trip per message
+    text_widget.insert(END, "".join(msg + "\n" for msg in messages))
     text_widget.config(state=DISABLED)
 
 
 # --------------------------
 # File Dialog
 # --------------------------
-def browse_file(file_path_var):
-    filename = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
-    if filename:
+def browse_file(file_path_var, parent=None):
+    current = file_path_var.get()
+    # Reopen in the last file's folder rather than re-scanning the default one
+    initialdir = os.path.dirname(current) if current else None
+    filename = filedialog.askopenfilename(filetypes=JSON_FILETYPES, initialdir=initialdir, parent=parent)
+    # Skip the set (and any variable traces) when the same file is picked again
+    if filename and filename != current:
         file_path_var.set(filename)
 
 
@@ -100,28 +114,42 @@ def get_credentials(root, engine_selection_var):
 #def toggle_translation_button(btn, is_running):
 #    btn.config(text="Cancel Translation" if is_running else "Start Translation")
 
+# Button options per state, built once rather than on every toggle
+RUNNING_BUTTON_OPTIONS = {
+    "text": "Stop Translation",
+    "bg": "#ffa000",  # orange
+    "fg": "black",
+    "state": NORMAL,
+    "cursor": "hand2",
+}
+IDLE_BUTTON_OPTIONS = {
+    "text": "Start Translation",
+    "bg": "#2e7d32",  # green
+    "fg": "white",
+    "state": NORMAL,
+    "cursor": "hand2",
+}
+
 def toggle_translation_button(btn, running):
     """
     Toggle the Start/Stop translation button.
     running=True  -> show Stop (orange with black text)
     running=False -> show Start (green with white text)
+    Does nothing when the button already shows that state.
     """
-    if running:
-        btn.config(
-            text="Stop Translation",
-            bg="#ffa000",  # orange
-            fg="black",
-            state=NORMAL,
-            cursor="hand2"
-        )
+    if getattr(btn, "_shown_running_style", None) == running:
+        return
+    btn.config(**(RUNNING_BUTTON_OPTIONS if running else IDLE_BUTTON_OPTIONS))
+    btn._shown_running_style = running
+
+
+def set_progress(progress_bar, value):
+    """Write the progress through the bar's bound variable when it has one."""
+    variable = str(progress_bar.cget("variable"))
+    if variable:
+        progress_bar.setvar(variable, value)
     else:
-        btn.config(
-            text="Start Translation",
-            bg="#2e7d32",  # green
-            fg="white",
-            state=NORMAL,
-            cursor="hand2"
-        )
+        progress_bar.configure(value=value)
 
 
 # --------------------------
@@ -135,6 +163,31 @@ def run_translation_thread(root, client_or_keys, creds, input_path, output_path,
     global cancel_flag_global
     cancel_flag_global = False
 
+    # Single-flight status delivery: the worker queues messages and schedules
+    # at most one flush at a time; the flush draws them on the Tk thread.
+    status_lock = threading.Lock()
+    pending_msgs = []
+    flush_scheduled = False
+    progress_counter = 0
+
+    def flush_status():
+        nonlocal flush_scheduled
+        with status_lock:
+            msgs = pending_msgs[:]
+            pending_msgs.clear()
+            progress_value = progress_counter
+            flush_scheduled = False
+        if not msgs:
+            return
+        if progress_bar:
+            set_progress(progress_bar, progress_value)
+        update_status_label(root, status_label, msgs, status_text)
+
+    def finish(text, fg):
+        # Drain queued messages first so they can't overwrite the final status
+        flush_status()
+        status_label.config(text=text, fg=fg)
+
     try:
         # Select correct logic file
         if mode == "blog":
@@ -144,33 +197,51 @@ def run_translation_thread(root, client_or_keys, creds, input_path, output_path,
 
         data = load_json(input_path)
         total_texts = len(collect_translatable_texts(data, source_lang)) * len(target_langs)
-        progress_counter = 0
+        last_render = 0.0
+        if progress_bar:
+            # The total is fixed for the run; per-update redraws only set the value
+            progress_bar.configure(maximum=total_texts)
 
         def status_cb(msg, batch_count=1):
-            nonlocal progress_counter
+            nonlocal progress_counter, last_render, flush_scheduled
             if cancel_flag_global:
                 raise Exception("Translation canceled by user")
-            progress_counter += batch_count
-            if progress_bar:
-                progress_bar["maximum"] = total_texts
-                progress_bar["value"] = progress_counter
-                progress_bar.update()
-            update_status_label(root, status_label, msg, status_text)
+
+            with status_lock:
+                progress_counter += batch_count
+                pending_msgs.append(msg)
+                if flush_scheduled:
+                    return
+                # Coalesce progress redraws: inside the interval, a trailing flush picks up
+                # everything queued meanwhile; plain status messages and the last step show at once
+                now = time.monotonic()
+                delay = 0.0
+                if batch_count and progress_counter < total_texts:
+                    delay = max(0.0, PROGRESS_MIN_INTERVAL - (now - last_render))
+                last_render = now + delay
+                flush_scheduled = True
+            if delay:
+                root.after(int(delay * 1000) + 1, flush_status)
+            else:
+                root.after_idle(flush_status)
 
         # --- Perform Translation ---
         translate(engine, creds, input_path, output_path, source_lang, target_langs, status_callback=status_cb)
 
         # ✅ Mark success AFTER thread truly completes
-        root.after(0, lambda: status_label.config(text="✅ Translation completed successfully!", fg="green"))
+        root.after(0, lambda: finish("✅ Translation completed successfully!", "green"))
 
     except Exception as e:
         if str(e) == "Translation canceled by user":
-            root.after(0, lambda: status_label.config(text="❌ Translation canceled.", fg="red"))
+            root.after(0, lambda: finish("❌ Translation canceled.", "red"))
         else:
-            root.after(0, lambda: status_label.config(text=f"❌ Translation failed: {e}", fg="red"))
+            failure_text = f"❌ Translation failed: {e}"
+            root.after(0, lambda: finish(failure_text, "red"))
     finally:
         # ✅ Reset everything back safely in main thread
         def reset_ui():
+            global _translation_running
+            _translation_running = False
             toggle_translation_button(btn, False)
             progress_bar.stop()
             root.protocol("WM_DELETE_WINDOW", root.quit)  # re-enable window close
@@ -185,8 +256,10 @@ def start_or_cancel_translation(root, btn, file_path_var, source_lang_entry, tar
     """
     Starts or cancels translation based on user interaction.
     """
-    global cancel_flag_global
+    global cancel_flag_global, _translation_running
     if btn.cget("text") == "Start Translation":
+        if _translation_running:
+            return
         input_path = file_path_var.get()
         source_lang = source_lang_entry.get().strip()
         target_langs = [x.strip() for x in target_langs_entry.get().split(",") if x.strip()]
@@ -201,42 +274,50 @@ def start_or_cancel_translation(root, btn, file_path_var, source_lang_entry, tar
             messagebox.showerror("Error", "Enter at least one target language.")
             return
 
-        # Disable window close while translating
-        root.protocol("WM_DELETE_WINDOW", lambda: messagebox.showwarning(
-            "Translation in Progress",
-            "Please stop or wait for the translation to finish before closing."
-        ))
-
-        client_or_keys, creds = get_credentials(root, engine_var)
-        if not client_or_keys:
-            root.protocol("WM_DELETE_WINDOW", root.quit)
-            return
-
-        # Prepare output
-        base_dir = os.path.dirname(input_path)
-        base_name = os.path.basename(input_path)
-        output_dir = os.path.join(base_dir, "Blog" if mode == "blog" else "Non-Blog")
-        os.makedirs(output_dir, exist_ok=True)
-
-        output_path = os.path.join(
-            output_dir,
-            base_name if mode == "blog" else base_name.replace(".json", "_translated.json")
-        )
-
-        # --- Toggle button to "Stop" state ---
-        toggle_translation_button(btn, True)
-        progress_bar["value"] = 0
-        progress_bar["maximum"] = 1
-        progress_bar.update()
-
-        # Start translation thread
-        thread = threading.Thread(
-            target=run_translation_thread,
-            args=(root, client_or_keys, creds, input_path, output_path,
-                  source_lang, target_langs, status_label, status_text,
-                  engine, progress_bar, btn, mode)
-        )
-        thread.start()
+        # Block re-entry (e.g. a second click while a credentials dialog is open)
+        # until this run finishes or fails to start
+        _translation_running = True
+        started = False
+        try:
+            # Disable window close while translating
+            root.protocol("WM_DELETE_WINDOW", lambda: messagebox.showwarning(
+                "Translation in Progress",
+                "Please stop or wait for the translation to finish before closing."
+            ))
+
+            client_or_keys, creds = get_credentials(root, engine_var)
+            if not client_or_keys:
+                root.protocol("WM_DELETE_WINDOW", root.quit)
+                return
+
+            # Prepare output
+            base_dir = os.path.dirname(input_path)
+            base_name = os.path.basename(input_path)
+            output_dir = os.path.join(base_dir, OUTPUT_DIRS.get(mode, "Non-Blog"))
+            os.makedirs(output_dir, exist_ok=True)
+
+            output_path = os.path.join(
+                output_dir,
+                base_name if mode == "blog" else base_name.replace(".json", "_translated.json")
+            )
+
+            # --- Toggle button to "Stop" state ---
+            toggle_translation_button(btn, True)
+            set_progress(progress_bar, 0)
+            progress_bar.configure(maximum=1)
+            progress_bar.update_idletasks()
+
+            # Run on the shared translation worker
+            _translation_executor.submit(
+                run_translation_thread,
+                root, client_or_keys, creds, input_path, output_path,
+                source_lang, target_langs, status_label, status_text,
+                engine, progress_bar, btn, mode
+            )
+            started = True
+        finally:
+            if not started:
+                _translation_running = False
 
     else:
         # --- Cancel translation ---
@@ -2,7 +2,7 @@
 
 import tkinter as tk
 from tkinter import messagebox
-import json, os
+from json_utils import load_json, save_json
 
 # -----------------------------
 # File paths and defaults
@@ -14,30 +14,25 @@ DEFAULT_LANGS = ["ar", "fr", "es"]
 # -----------------------------
 # Load language map
 # -----------------------------
-if os.path.exists(LANG_MAP_FILE):
-    with open(LANG_MAP_FILE, "r", encoding="utf-8") as f:
-        ISO_LANG_MAP = json.load(f)
-else:
+try:
+    ISO_LANG_MAP = load_json(LANG_MAP_FILE)
+except FileNotFoundError:
     ISO_LANG_MAP = {"ar": "Arabic", "fr": "French", "es": "Spanish"}  # fallback
 
 # -----------------------------
 # Load user-selected languages
 # -----------------------------
-if os.path.exists(LANG_FILE):
-    try:
-        with open(LANG_FILE, "r", encoding="utf-8") as f:
-            languages = json.load(f)
-    except Exception:
-        languages = DEFAULT_LANGS.copy()
-else:
+try:
+    languages = load_json(LANG_FILE)
+except Exception:  # missing or unreadable
     languages = DEFAULT_LANGS.copy()
 
 # -----------------------------
 # Save/load helpers
 # -----------------------------
 def save_languages():
-    with open(LANG_FILE, "w", encoding="utf-8") as f:
-        json.dump(languages, f, ensure_ascii=False, indent=2)
+    # One serialize + one write instead of json.dump's per-token writes
+    save_json(languages, LANG_FILE)
 
 def get_languages():
     return languages.copy()
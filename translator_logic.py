@@ -1,106 +1,118 @@
-import json
 import copy
 import os
-from translate_openai import openai_translate_batch, verify_openai_key
-from translate_aws import amazon_translate_batch, verify_aws_credentials
+from json_utils import load_json, save_json
 
-BATCH_SIZE = 5
+def _is_blank_text(value):
+    return isinstance(value, str) and not value.strip()
 
-# --------------------------
-# JSON Helpers
-# --------------------------
-def load_json(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def save_json(data, path):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def _prune_empty_texts(node):
+    """
+    Single-level form of remove_empty_texts, applied by the collectors as they
+    visit each node so the document does not need a separate cleanup pass.
+    """
+    if isinstance(node, dict):
+        if _is_blank_text(node.get("text")):
+            del node["text"]
+    elif isinstance(node, list):
+        kept = [item for item in node if not (isinstance(item, dict) and _is_blank_text(item.get("text")))]
+        if len(kept) != len(node):
+            node[:] = kept
 
-def collect_texts_from_content_array(content_array, current_path, texts_output, source_lang, engine):
+def collect_texts_from_content_array(content_array, texts_output, source_lang, engine, prune_empty=False):
     """
-    Collects 'text' fields inside structured content arrays.
+    Collects 'text' fields inside structured content arrays as ((node, "text"), text).
     It skips empty 'text' fields only for Amazon, as it rejects them.
+    Walks iteratively and appends straight into texts_output.
+    With prune_empty=True, blank 'text' entries are removed in place on the way.
     """
-    if isinstance(content_array, dict):
-        if "text" in content_array and isinstance(content_array["text"], str):
-            text_value = content_array["text"]
-            # Keep the check here to skip empty 'text' nodes inside content structures for Amazon
-            if engine == "amazon" and not text_value:
-                return
-            texts_output.append((current_path + ("text",), text_value))
-        for key, value in content_array.items():
-            if isinstance(value, (dict, list)):
-                collect_texts_from_content_array(value, current_path + (key,), texts_output, source_lang, engine)
-
-    elif isinstance(content_array, list):
-        for idx, item in enumerate(content_array):
-            if isinstance(item, (dict, list)):
-                collect_texts_from_content_array(item, current_path + (idx,), texts_output, source_lang, engine)
+    stack = [content_array]
+    while stack:
+        node = stack.pop()
+        if prune_empty:
+            _prune_empty_texts(node)
+        if isinstance(node, dict):
+            if isinstance(node.get("text"), str):
+                text_value = node["text"]
+                # Keep the check here to skip empty 'text' nodes inside content structures for Amazon
+                if engine == "amazon" and not text_value:
+                    continue
+                texts_output.append(((node, "text"), text_value))
+            children = [value for value in node.values() if isinstance(value, (dict, list))]
+        elif isinstance(node, list):
+            children = [item for item in node if isinstance(item, (dict, list))]
+        else:
+            continue
+        # Push in reverse so the first child is visited next
+        stack.extend(reversed(children))
     return texts_output
 
 # ---
 
-def collect_translatable_texts(node, source_lang, path=(), engine="openai"):
+def collect_translatable_texts(node, source_lang, engine="openai", prune_empty=False):
     """
     Collects all language-specific texts (e.g., 'title': {'en': '...'}) and 
-    calls helper for nested content. This function now collects ALL paths, 
+    calls helper for nested content. This function now collects ALL fields, 
     including those with empty strings, so the structure is preserved.
+    Each entry is (ref, text) where ref is the (container, key) to write to;
+    key is None for a language dict, meaning "the target language slot".
+    With prune_empty=True it also does remove_empty_texts' work on every node
+    it visits, fusing the cleanup into the same pass.
     """
     texts = []
-    if isinstance(node, dict):
-        for key, value in node.items():
-            # Handle nested additionalContent correctly
-            if key == "additionalContent" and isinstance(value, dict) and source_lang in value and isinstance(value[source_lang], list):
-                for item_idx, item in enumerate(value[source_lang]):
-                    texts.extend(
-                        collect_texts_from_content_array(
-                            item,
-                            path + (key, source_lang, item_idx),
-                            [],
-                            source_lang,
-                            engine, # Pass engine to helper, which handles its own skipping
-                        )
-                    )
-
-            # Collect language-specific fields (e.g., "title": {"en": "..."})
-            elif isinstance(value, dict) and source_lang in value and isinstance(value[source_lang], str):
-                # We collect the path even if the text is empty!
-                texts.append((path + (key,), value[source_lang]))
-            else:
-                texts.extend(collect_translatable_texts(value, source_lang, path + (key,), engine))
-    elif isinstance(node, list):
-        for idx, item in enumerate(node):
-            texts.extend(collect_translatable_texts(item, source_lang, path + (idx,), engine))
+    # Stack entries are (kind, value, ref); "text" entries are queued alongside
+    # subtrees so the output keeps document order without recursion.
+    stack = [("node", node, None)]
+    while stack:
+        kind, current, ref = stack.pop()
+        if kind == "text":
+            texts.append((ref, current))
+            continue
+        if kind == "content":
+            # Pass engine to helper, which handles its own skipping
+            collect_texts_from_content_array(current, texts, source_lang, engine, prune_empty)
+            continue
+
+        if prune_empty:
+            _prune_empty_texts(current)
+        pending = []
+        if isinstance(current, dict):
+            for key, value in current.items():
+                # Handle nested additionalContent correctly
+                if key == "additionalContent" and isinstance(value, dict) and isinstance(value.get(source_lang), list):
+                    pending.append(("content", value[source_lang], None))
+
+                # Collect language-specific fields (e.g., "title": {"en": "..."})
+                elif isinstance(value, dict) and isinstance(value.get(source_lang), str):
+                    # We collect the field even if the text is empty!
+                    pending.append(("text", value[source_lang], (value, None)))
+                elif isinstance(value, (dict, list)):
+                    pending.append(("node", value, None))
+        elif isinstance(current, list):
+            for item in current:
+                if isinstance(item, (dict, list)):
+                    pending.append(("node", item, None))
+        stack.extend(reversed(pending))
     return texts
 
 
-def apply_translations(node, translations, paths, target_lang, source_lang):
-    for path, text in zip(paths, translations):
-        ptr = node
-        for key in path[:-1]:
-            if isinstance(ptr, list):
-                ptr = ptr[int(key)]
-            else:
-                ptr = ptr[key]
-        final_key = path[-1]
-
-        # FIX #2: prevent language mixing — only update source_lang section
-        if isinstance(ptr, dict) and final_key in ptr and isinstance(ptr[final_key], dict):
-            if source_lang in ptr[final_key]:
-                # This ensures {"en": "", "ar": ""} structure is created/updated
-                ptr[final_key][target_lang] = text
-        elif isinstance(ptr, dict) and final_key == "text" and "text" in ptr:
-            ptr["text"] = text
+def apply_translations(refs, translations, target_lang):
+    """Write translations straight into the (container, key) refs from collection."""
+    for (container, key), text in zip(refs, translations):
+        if key is None:
+            # FIX #2: prevent language mixing — language dicts only gain the target slot,
+            # this ensures {"en": "", "ar": ""} structure is created/updated
+            container[target_lang] = text
         else:
-            ptr[final_key] = text
-    return node
+            container[key] = text
 
 
 def verify_and_prepare_client(engine, creds):
+    # Import the engine SDK only when that engine is actually used
     if engine == "openai":
+        from translate_openai import verify_openai_key
         return verify_openai_key(creds.get("openai_key"))
     elif engine == "amazon":
+        from translate_aws import verify_aws_credentials
         return verify_aws_credentials(creds.get("aws_access_key"), creds.get("aws_secret_key"))
     return None
 
@@ -135,61 +147,35 @@ def remove_empty_texts(node):
 
 def translate(engine, creds, input_path, output_path, source_lang, target_langs, status_callback=None):
     data = load_json(input_path)
-    remove_empty_texts(data)
-    original_en = copy.deepcopy(data)
 
-    # 1. Collect ALL translatable texts and their paths
-    all_texts_to_translate = collect_translatable_texts(data, source_lang, engine=engine)
+    # 1. Collect ALL translatable texts and their refs, dropping empty 'text' nodes on the way
+    all_texts_to_translate = collect_translatable_texts(data, source_lang, engine=engine, prune_empty=True)
     if not all_texts_to_translate:
         if status_callback:
             status_callback("No translatable texts found.", batch_count=0)
         return
 
-    all_paths, all_source_texts = zip(*all_texts_to_translate)
+    all_refs, all_source_texts = zip(*all_texts_to_translate)
 
     # ✅ Prepare base structure once (so multiple languages accumulate)
-    translated_data = copy.deepcopy(data)
+    translated_data = data
 
     # 2. Filter out empty texts for API calls
-    paths_for_api = []
-    texts_for_api = []
-    api_map = {}  # Maps API path index back to original index
-
-    for i, (path, text) in enumerate(zip(all_paths, all_source_texts)):
-        if text:  # Only non-empty texts go to API
-            paths_for_api.append(path)
-            texts_for_api.append(text)
-            api_map[len(paths_for_api) - 1] = i
-
-    # 3. Loop through each target language
-    for target_lang in target_langs:
-        if status_callback:
-            status_callback(f"Translating to {target_lang}...", batch_count=0)
-
-        all_translations = []
+    texts_for_api = [text for text in all_source_texts if text]
 
-        if texts_for_api:
-            for i in range(0, len(texts_for_api), BATCH_SIZE):
-                batch_texts = list(texts_for_api[i:i + BATCH_SIZE])
+    # Content 'text' nodes are translated inside the source additionalContent,
+    # copied to the target, then put back (language dicts never touch the source)
+    content_texts = [(ref, text) for ref, text in all_texts_to_translate if ref[1] is not None]
 
-                if engine == "openai":
-                    batch_translations = openai_translate_batch(
-                        creds["openai_key"], batch_texts, source_lang, target_lang
-                    )
-                elif engine == "amazon":
-                    batch_translations = amazon_translate_batch(
-                        creds["aws_access_key"], creds["aws_secret_key"],
-                        batch_texts, source_lang, target_lang
-                    )
-                else:
-                    raise ValueError("Unknown translation engine")
+    # 3. Translate every target language concurrently
+    # (asyncio and the cache are only loaded once a translation actually runs)
+    from translator_engine import translate_texts
+    translations_by_lang = translate_texts(
+        engine, creds, texts_for_api, source_lang, target_langs, status_callback
+    )
 
-                all_translations.extend(batch_translations)
-                if status_callback:
-                    status_callback(
-                        f"{len(all_translations)}/{len(texts_for_api)} texts translated for {target_lang}",
-                        batch_count=len(batch_texts)
-                    )
+    for target_lang in target_langs:
+        all_translations = translations_by_lang[target_lang]
 
         # 4. Merge back into structure
         final_translations = []
@@ -202,12 +188,13 @@ def translate(engine, creds, input_path, output_path, source_lang, target_langs,
                 final_translations.append("")
 
         # 5. Apply translations ON TOP of previous ones
-        translated_data = apply_translations(
-            translated_data, final_translations, all_paths, target_lang, source_lang
-        )
+        apply_translations(all_refs, final_translations, target_lang)
 
-        # Clone additionalContent after translations
-        def find_and_copy_content(node, source, target):
+        # Clone additionalContent after translations.
+        # `in_source` marks nodes of the original document (not inside a copy).
+        # Source content lists there are put back to their original state below,
+        # so no copies are planted inside them.
+        def find_and_copy_content(node, source, target, in_source=True, is_content=False):
             if isinstance(node, dict):
                 if (
                     "additionalContent" in node
@@ -215,40 +202,25 @@ def translate(engine, creds, input_path, output_path, source_lang, target_langs,
                     and source in node["additionalContent"]
                 ):
                     node["additionalContent"][target] = copy.deepcopy(node["additionalContent"][source])
+                source_is_list = in_source and is_content and isinstance(node.get(source), list)
                 for k, v in node.items():
-                    if isinstance(v, (dict, list)):
-                        find_and_copy_content(v, source, target)
+                    if not isinstance(v, (dict, list)):
+                        continue
+                    child_in_source = in_source
+                    if in_source and is_content:
+                        if source_is_list and k == source:
+                            continue
+                        child_in_source = not source_is_list and k != target
+                    find_and_copy_content(v, source, target, child_in_source, k == "additionalContent")
             elif isinstance(node, list):
                 for item in node:
-                    find_and_copy_content(item, source, target)
+                    find_and_copy_content(item, source, target, in_source)
 
         find_and_copy_content(translated_data, source_lang, target_lang)
 
         # Restore original 'en' content each time
-        def restore_original_lang(node, backup, lang):
-            if isinstance(node, dict) and isinstance(backup, dict):
-                for k, v in node.items():
-                    if (
-                        k == "additionalContent"
-                        and isinstance(v, dict)
-                        and lang in v
-                        and isinstance(backup.get("additionalContent", {}).get(lang), list)
-                    ):
-                        node["additionalContent"][lang] = copy.deepcopy(
-                            backup["additionalContent"][lang]
-                        )
-                    elif isinstance(v, dict) and k in backup:
-                        restore_original_lang(v, backup[k], lang)
-                    elif isinstance(v, list) and k in backup:
-                        for i, item in enumerate(v):
-                            if i < len(backup[k]):
-                                restore_original_lang(item, backup[k][i], lang)
-            elif isinstance(node, list) and isinstance(backup, list):
-                for i, item in enumerate(node):
-                    if i < len(backup):
-                        restore_original_lang(item, backup[i], lang)
-
-        restore_original_lang(translated_data, original_en, source_lang)
+        for (container, key), text in content_texts:
+            container[key] = text
 
     # 6. Final cleanup and save once
     remove_empty_texts(translated_data)
@@ -1,10 +1,9 @@
-import os
-import json
 import argparse
-from tkinter import *
+from tkinter import Tk, Menu, Frame, Label, Entry, Button, StringVar, IntVar, BOTH, BOTTOM, LEFT, W, X
 from tkinter import ttk, messagebox
 from translator_gui_functions import browse_file, start_or_cancel_translation, show_messages_popup
 from translator_lang import get_languages, open_language_popup
+from json_utils import load_json
 
 # --------------------------
 # Parse engine from arguments
@@ -16,13 +15,15 @@ ENGINE = args.engine.lower().strip()
 
 CREDENTIALS_FILE = "api_credentials.json"
 
-# Load credentials
-if not os.path.exists(CREDENTIALS_FILE):
+# Load credentials (one read + parse; no separate exists() check)
+try:
+    creds_all = load_json(CREDENTIALS_FILE)
+except FileNotFoundError:
     messagebox.showerror("Missing Credentials", f"Credentials file not found:\n{CREDENTIALS_FILE}")
     raise SystemExit
-
-with open(CREDENTIALS_FILE, "r", encoding="utf-8") as f:
-    creds_all = json.load(f)
+except ValueError:
+    messagebox.showerror("Invalid Credentials", f"Credentials file is not valid JSON:\n{CREDENTIALS_FILE}")
+    raise SystemExit
 
 if ENGINE not in creds_all:
     messagebox.showerror("Missing Engine Keys", f"No credentials found for '{ENGINE}' in {CREDENTIALS_FILE}")
@@ -34,6 +35,7 @@ CREDENTIALS = creds_all[ENGINE]
 # Root Window Setup
 # --------------------------
 root = Tk()
+root.withdraw()  # Hidden while widgets are built; shown once with the final layout
 root.title(f"JSON Translator – {ENGINE.capitalize()}")
 root.geometry("440x460")  # Slightly taller for macOS visibility
 root.resizable(False, False)
@@ -77,7 +79,7 @@ Label(content_frame, text="Select Source JSON File:").pack(anchor=W)
 file_frame = Frame(content_frame)
 file_frame.pack(fill=X, pady=(0, 5))
 Entry(file_frame, textvariable=file_path, width=40).pack(side=LEFT, fill=X, expand=True)
-Button(file_frame, text="Browse", command=lambda: browse_file(file_path)).pack(side=LEFT, padx=5)
+Button(file_frame, text="Browse", command=lambda: browse_file(file_path, root)).pack(side=LEFT, padx=5)
 
 # Source language
 Label(content_frame, text="Source Language:").pack(anchor=W, pady=(5, 0))
@@ -115,7 +117,9 @@ mode_toggle = ttk.Checkbutton(
 mode_toggle.pack(side=LEFT)
 
 # Progress bar
-progress_bar = ttk.Progressbar(content_frame, orient="horizontal", length=380, mode="determinate")
+progress_value = IntVar(value=0)
+progress_bar = ttk.Progressbar(content_frame, orient="horizontal", length=380, mode="determinate",
+                               variable=progress_value)
 progress_bar.pack(pady=(5, 10))
 
 # --------------------------
@@ -169,4 +173,6 @@ Label(
     font=("Arial", 8),
 ).pack(fill=X)
 
+root.update_idletasks()
+root.deiconify()
 root.mainloop()